@@ -1,14 +1,84 @@
 """
 ScrapeConfig class that mimics ScrapFly's configuration interface.
 """
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Final, List, Optional, Any
 
+# Prefixes identifying a JSON request body; built once rather than as a fresh
+# tuple argument on every startswith call.
+_JSON_STARTS: Final = ("{", "[")
 
-@dataclass
+# Action-type strings interned once at import, so the handler table hashes and
+# compares pointers and repeated browserAction dicts reuse the same objects.
+_T_WAIT_FOR_SELECTOR = sys.intern("wait_for_selector")
+_T_CLICK = sys.intern("click")
+_T_WAIT = sys.intern("wait")
+_T_SCROLL = sys.intern("scroll")
+_T_EXECUTE_JS = sys.intern("execute_js")
+_T_JS = sys.intern("js")
+_T_TYPE = sys.intern("type")
+
+# Shape bits describing which ScrapeConfig fields are populated. Scrapers
+# typically reuse a handful of config shapes (same fields set, varying url),
+# so payload builders are specialized per shape and cached by this bitmask.
+(
+    _S_COUNTRY,
+    _S_HEADERS,
+    _S_COOKIES,
+    _S_BODY,
+    _S_DATA,
+    _S_WAIT_SEL,
+    _S_JS_SCENARIO,
+    _S_JS,
+    _S_AUTO_SCROLL,
+    _S_RENDER_WAIT,
+    _S_CAPTCHA,
+    _S_EXTRA,
+) = (1 << i for i in range(12))
+
+_SHAPE_CACHE: Dict[int, Any] = {}
+
+
+# Fields whose values match what the Scrappey server already applies by
+# default. They are stripped from outgoing payloads to keep the serialized
+# request small; pass force_defaults=True to emit them explicitly.
+_SERVER_DEFAULTS = {
+    "premiumProxy": True,
+    "automaticallySolveCaptchas": True,
+}
+
+# Built once at import time so payload serialization does a single dict lookup
+# instead of rebuilding this table on every call.
+_COUNTRY_MAP = {
+    "US": "UnitedStates", "CA": "Canada", "GB": "UnitedKingdom",
+    "UK": "UnitedKingdom", "DE": "Germany", "FR": "France",
+    "ES": "Spain", "IT": "Italy", "NL": "Netherlands",
+    "AU": "Australia", "JP": "Japan", "BR": "Brazil",
+    "MX": "Mexico", "IN": "India", "CN": "China",
+    "RU": "Russia", "KR": "SouthKorea", "SG": "Singapore",
+    "HK": "HongKong", "TW": "Taiwan", "PL": "Poland",
+    "SE": "Sweden", "NO": "Norway", "DK": "Denmark",
+    "FI": "Finland", "CH": "Switzerland", "AT": "Austria",
+    "BE": "Belgium", "IE": "Ireland", "PT": "Portugal",
+    "GR": "Greece", "CZ": "CzechRepublic", "RO": "Romania",
+    "HU": "Hungary", "TR": "Turkey", "IL": "Israel",
+    "AE": "UnitedArabEmirates", "SA": "SaudiArabia",
+    "ZA": "SouthAfrica", "AR": "Argentina", "CL": "Chile",
+    "CO": "Colombia", "NZ": "NewZealand", "TH": "Thailand",
+    "PH": "Philippines", "MY": "Malaysia", "ID": "Indonesia",
+    "VN": "Vietnam",
+}
+
+
+@dataclass(slots=True)
 class ScrapeConfig:
     """
     Configuration for a scrape request, matching ScrapFly's ScrapeConfig interface.
+
+    Slotted so that high-volume scrapers building thousands of configs per
+    batch don't pay the per-instance __dict__ overhead. Ad-hoc parameters
+    belong in ``extra`` rather than as new attributes.
     """
     url: str
     asp: bool = True
@@ -36,157 +106,237 @@ class ScrapeConfig:
     auto_solve_captcha: bool = True  # Automatically solve captchas (reCAPTCHA, hCaptcha, Turnstile, etc.)
     extra: Dict[str, Any] = field(default_factory=dict)
     
-    def to_scrappey_payload(self, session_id: Optional[str] = None) -> Dict[str, Any]:
-        """Convert this config to a Scrappey API payload."""
-        method_lower = self.method.lower()
-        cmd = f"request.{method_lower}"
-        
-        payload: Dict[str, Any] = {
-            "cmd": cmd,
-            "url": self.url,
-            # Always use premium proxy for faster, more reliable scraping
-            "premiumProxy": True,
-        }
-        
-        if session_id:
-            payload["session"] = session_id
-        elif self.session:
-            payload["session"] = self.session
-        
-        if self.country:
-            payload["proxyCountry"] = self._map_country_code(self.country)
-        
-        if self.headers:
-            # Lowercase all header keys for consistency
-            payload["customHeaders"] = {k.lower(): v for k, v in self.headers.items()}
-        
-        if self.cookies:
-            cookie_str = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
-            if "customHeaders" not in payload:
-                payload["customHeaders"] = {}
-            payload["customHeaders"]["cookie"] = cookie_str
-        
-        if self.body:
-            payload["postData"] = self.body
-            # Auto-set content-type for JSON body
-            if self.body.strip().startswith(('{', '[')):
-                if "customHeaders" not in payload:
-                    payload["customHeaders"] = {}
-                if "content-type" not in payload["customHeaders"]:
-                    payload["customHeaders"]["content-type"] = "application/json"
-        
-        if self.data:
-            payload["postData"] = self.data
-            # Dict data is JSON, set content-type
-            if isinstance(self.data, dict):
-                if "customHeaders" not in payload:
-                    payload["customHeaders"] = {}
-                if "content-type" not in payload["customHeaders"]:
-                    payload["customHeaders"]["content-type"] = "application/json"
-        
-        browser_actions = []
-        
-        if self.wait_for_selector:
-            wait_action = {
-                "type": "wait_for_selector",
-                "cssSelector": self.wait_for_selector,
-                "timeout": 30000
-            }
-            # Allow ignoring errors for wait_for_selector (won't crash if element not found)
-            if self.extra.get("waitForSelectorIgnoreErrors"):
-                wait_action["ignoreErrors"] = True
-            browser_actions.append(wait_action)
-        
-        if self.js_scenario:
-            for action in self.js_scenario:
-                browser_actions.append(self._convert_js_scenario_action(action))
-        
-        if self.js:
-            browser_actions.append({
-                "type": "execute_js",
-                "code": self.js
-            })
-        
-        if self.auto_scroll:
-            browser_actions.append({
-                "type": "scroll"
-            })
-        
-        if self.rendering_wait:
-            # Convert milliseconds to seconds (Scrappey uses seconds)
-            wait_seconds = self.rendering_wait / 1000 if self.rendering_wait > 100 else self.rendering_wait
-            browser_actions.append({
-                "type": "wait",
-                "wait": wait_seconds
-            })
-        
-        if browser_actions:
-            payload["browserActions"] = browser_actions
-        
-        # Enable automatic captcha solving
-        if self.auto_solve_captcha:
-            payload["automaticallySolveCaptchas"] = True
-        
-        # Include any extra parameters
-        if self.extra:
-            payload.update(self.extra)
-        
+    def to_scrappey_payload(
+        self,
+        session_id: Optional[str] = None,
+        force_defaults: bool = False
+    ) -> Dict[str, Any]:
+        """Convert this config to a Scrappey API payload.
+
+        Fields matching the server-side defaults are omitted to shrink the
+        request body; set force_defaults=True to include them anyway.
+
+        Dispatches to a builder specialized (via one-time codegen, see
+        _compile_payload_builder) for this config's shape - the set of
+        fields that are actually populated - so repeat shapes skip every
+        dead branch below.
+        """
+        shape = (
+            (_S_COUNTRY if self.country else 0)
+            | (_S_HEADERS if self.headers else 0)
+            | (_S_COOKIES if self.cookies else 0)
+            | (_S_BODY if self.body else 0)
+            | (_S_DATA if self.data else 0)
+            | (_S_WAIT_SEL if self.wait_for_selector else 0)
+            | (_S_JS_SCENARIO if self.js_scenario else 0)
+            | (_S_JS if self.js else 0)
+            | (_S_AUTO_SCROLL if self.auto_scroll else 0)
+            | (_S_RENDER_WAIT if self.rendering_wait else 0)
+            | (_S_CAPTCHA if self.auto_solve_captcha else 0)
+            | (_S_EXTRA if self.extra else 0)
+        )
+        builder = _SHAPE_CACHE.get(shape)
+        if builder is None:
+            builder = _SHAPE_CACHE[shape] = _compile_payload_builder(shape)
+        return builder(self, session_id, force_defaults)
+
+    @classmethod
+    def to_batch_payload(
+        cls,
+        configs: List["ScrapeConfig"],
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Bundle several configs into a single Scrappey batch payload.
+
+        Sending one request.batch command instead of N individual requests
+        amortizes the HTTP round-trip for high-volume scrapes. Fields that
+        are identical across every bundled request (premium proxy, captcha
+        solving, proxy country) are hoisted into the batch envelope to keep
+        the serialized payload small.
+        """
+        # force_defaults=True so premiumProxy/automaticallySolveCaptchas
+        # appear explicitly in each entry and are visible to the hoisting
+        # below; the per-payload default stripping would otherwise have
+        # removed them already.
+        requests = [
+            config.to_scrappey_payload(session_id, force_defaults=True)
+            for config in configs
+        ]
+        payload: Dict[str, Any] = {"cmd": "request.batch", "requests": requests}
+        if requests:
+            first = requests[0]
+            for key in ("premiumProxy", "automaticallySolveCaptchas", "proxyCountry"):
+                if key in first and all(req.get(key) == first[key] for req in requests):
+                    value = first[key]
+                    for req in requests:
+                        del req[key]
+                    # A hoisted value that matches the server default can be
+                    # omitted from the envelope entirely.
+                    if _SERVER_DEFAULTS.get(key) != value:
+                        payload[key] = value
         return payload
-    
-    def _map_country_code(self, code: str) -> str:
+
+    @staticmethod
+    def _map_country_code(code: str) -> str:
         """Map 2-letter country codes to Scrappey's full country names."""
-        country_map = {
-            "US": "UnitedStates", "CA": "Canada", "GB": "UnitedKingdom",
-            "UK": "UnitedKingdom", "DE": "Germany", "FR": "France",
-            "ES": "Spain", "IT": "Italy", "NL": "Netherlands",
-            "AU": "Australia", "JP": "Japan", "BR": "Brazil",
-            "MX": "Mexico", "IN": "India", "CN": "China",
-            "RU": "Russia", "KR": "SouthKorea", "SG": "Singapore",
-            "HK": "HongKong", "TW": "Taiwan", "PL": "Poland",
-            "SE": "Sweden", "NO": "Norway", "DK": "Denmark",
-            "FI": "Finland", "CH": "Switzerland", "AT": "Austria",
-            "BE": "Belgium", "IE": "Ireland", "PT": "Portugal",
-            "GR": "Greece", "CZ": "CzechRepublic", "RO": "Romania",
-            "HU": "Hungary", "TR": "Turkey", "IL": "Israel",
-            "AE": "UnitedArabEmirates", "SA": "SaudiArabia",
-            "ZA": "SouthAfrica", "AR": "Argentina", "CL": "Chile",
-            "CO": "Colombia", "NZ": "NewZealand", "TH": "Thailand",
-            "PH": "Philippines", "MY": "Malaysia", "ID": "Indonesia",
-            "VN": "Vietnam",
-        }
-        return country_map.get(code.upper(), code)
+        return _COUNTRY_MAP.get(code.upper(), code)
     
     def _convert_js_scenario_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
         """Convert ScrapFly js_scenario action to Scrappey browserAction format."""
-        if "wait_for_selector" in action:
-            return {
-                "type": "wait_for_selector",
-                "cssSelector": action["wait_for_selector"].get("selector"),
-                "timeout": action["wait_for_selector"].get("timeout", 30000)
-            }
-        elif "click" in action:
-            click_data = action["click"]
-            result = {"type": "click", "cssSelector": click_data.get("selector")}
-            if click_data.get("ignore_if_not_visible"):
-                result["ignoreErrors"] = True
-            return result
-        elif "wait" in action:
-            return {"type": "wait", "wait": action["wait"]}
-        elif "scroll" in action:
-            scroll_data = action.get("scroll", {})
-            result = {"type": "scroll"}
-            if isinstance(scroll_data, dict) and scroll_data.get("selector"):
-                result["cssSelector"] = scroll_data.get("selector")
-            return result
-        elif "execute_js" in action or "js" in action:
-            code = action.get("execute_js", action.get("js", ""))
-            return {"type": "execute_js", "code": code}
-        elif "type" in action and "selector" in action:
-            # Handle typing action
-            return {
-                "type": "type",
-                "cssSelector": action.get("selector"),
-                "text": action.get("text", "")
-            }
+        if len(action) == 1:
+            # Fast path: the normal single-key action needs one lookup
+            for key in action:
+                handler = _ACTION_HANDLERS.get(key)
+                if handler:
+                    result = handler(action)
+                    if result is not None:
+                        return result
+            return action
+        # Multi-key actions (e.g. type + selector + wait) resolve in the
+        # table's fixed priority order, not the caller's dict insertion order
+        for key, handler in _ACTION_HANDLERS.items():
+            if key in action:
+                result = handler(action)
+                if result is not None:
+                    return result
         return action
 
+
+def _action_wait_for_selector(action: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": _T_WAIT_FOR_SELECTOR,
+        "cssSelector": action["wait_for_selector"].get("selector"),
+        "timeout": action["wait_for_selector"].get("timeout", 30000)
+    }
+
+
+def _action_click(action: Dict[str, Any]) -> Dict[str, Any]:
+    click_data = action["click"]
+    result = {"type": _T_CLICK, "cssSelector": click_data.get("selector")}
+    if click_data.get("ignore_if_not_visible"):
+        result["ignoreErrors"] = True
+    return result
+
+
+def _action_wait(action: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": _T_WAIT, "wait": action[_T_WAIT]}
+
+
+def _action_scroll(action: Dict[str, Any]) -> Dict[str, Any]:
+    # dispatch guarantees the key exists, so no default-dict fallback needed
+    scroll_data = action["scroll"]
+    result = {"type": _T_SCROLL}
+    if isinstance(scroll_data, dict) and (selector := scroll_data.get("selector")):
+        result["cssSelector"] = selector
+    return result
+
+
+def _action_execute_js(action: Dict[str, Any]) -> Dict[str, Any]:
+    code = action.get("execute_js", action.get("js", ""))
+    return {"type": _T_EXECUTE_JS, "code": code}
+
+
+def _action_type(action: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    # Typing actions need both "type" and "selector"; returning None lets
+    # dispatch fall through to the other keys of the action.
+    if "selector" not in action:
+        return None
+    return {
+        "type": _T_TYPE,
+        "cssSelector": action.get("selector"),
+        "text": action.get("text", "")
+    }
+
+
+# Dispatch table mapping ScrapFly action keys to converters, so each action
+# dict is resolved with a single lookup instead of an if/elif chain. Entry
+# order doubles as the dispatch priority for multi-key actions.
+_ACTION_HANDLERS = {
+    _T_WAIT_FOR_SELECTOR: _action_wait_for_selector,
+    _T_CLICK: _action_click,
+    _T_WAIT: _action_wait,
+    _T_SCROLL: _action_scroll,
+    _T_EXECUTE_JS: _action_execute_js,
+    _T_JS: _action_execute_js,
+    _T_TYPE: _action_type,
+}
+
+
+def _compile_payload_builder(shape: int):
+    """Generate a payload builder containing only the branches live for shape.
+
+    This is the single source of truth for the payload format: each
+    populated field contributes its block of source, empty fields contribute
+    nothing, and the result is compiled once and cached in _SHAPE_CACHE. The
+    generated function still re-checks values that can only be known per
+    call (the session argument, body sniffing, the rendering_wait unit
+    heuristic).
+    """
+    lines = [
+        "def _build(self, session_id, force_defaults):",
+        "    session = session_id or self.session",
+        "    payload = {",
+        "        'cmd': 'request.' + self.method.lower(),",
+        "        'url': self.url,",
+        "        'premiumProxy': True,",
+        "        **({'session': session} if session else {}),",
+    ]
+    if shape & _S_COUNTRY:
+        lines.append("        'proxyCountry': _COUNTRY_MAP.get(self.country.upper(), self.country),")
+    lines.append("    }")
+    if shape & _S_HEADERS:
+        lines.append("    payload['customHeaders'] = {k.lower(): v for k, v in self.headers.items()}")
+    if shape & _S_COOKIES:
+        lines.append(
+            "    payload.setdefault('customHeaders', {})['cookie'] = "
+            "'; '.join([k + '=' + v for k, v in self.cookies.items()])"
+        )
+    if shape & _S_BODY:
+        lines += [
+            "    payload['postData'] = self.body",
+            "    if self.body.strip().startswith(_JSON_STARTS):",
+            "        payload.setdefault('customHeaders', {}).setdefault('content-type', 'application/json')",
+        ]
+    if shape & _S_DATA:
+        lines += [
+            "    payload['postData'] = self.data",
+            "    if isinstance(self.data, dict):",
+            "        payload.setdefault('customHeaders', {}).setdefault('content-type', 'application/json')",
+        ]
+    if shape & (_S_WAIT_SEL | _S_JS_SCENARIO | _S_JS | _S_AUTO_SCROLL | _S_RENDER_WAIT):
+        lines.append("    browser_actions = payload['browserActions'] = []")
+        if shape & _S_WAIT_SEL:
+            lines += [
+                "    wait_action = {'type': _T_WAIT_FOR_SELECTOR, 'cssSelector': self.wait_for_selector, 'timeout': 30000}",
+                "    if self.extra.get('waitForSelectorIgnoreErrors'):",
+                "        wait_action['ignoreErrors'] = True",
+                "    browser_actions.append(wait_action)",
+            ]
+        if shape & _S_JS_SCENARIO:
+            lines += [
+                "    for action in self.js_scenario:",
+                "        browser_actions.append(self._convert_js_scenario_action(action))",
+            ]
+        if shape & _S_JS:
+            lines.append("    browser_actions.append({'type': _T_EXECUTE_JS, 'code': self.js})")
+        if shape & _S_AUTO_SCROLL:
+            lines.append("    browser_actions.append({'type': _T_SCROLL})")
+        if shape & _S_RENDER_WAIT:
+            lines += [
+                "    wait_seconds = self.rendering_wait / 1000 if self.rendering_wait > 100 else self.rendering_wait",
+                "    browser_actions.append({'type': _T_WAIT, 'wait': wait_seconds})",
+            ]
+    if shape & _S_CAPTCHA:
+        lines.append("    payload['automaticallySolveCaptchas'] = True")
+    if shape & _S_EXTRA:
+        lines.append("    payload.update(self.extra)")
+    lines += [
+        "    if not force_defaults:",
+        "        for key, default in _SERVER_DEFAULTS.items():",
+        "            if key in payload and payload[key] == default:",
+        "                del payload[key]",
+        "    return payload",
+    ]
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<payload builder shape={shape:#x}>", "exec"), globals(), namespace)
+    return namespace["_build"]
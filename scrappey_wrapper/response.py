@@ -1,12 +1,78 @@
 """
 ScrapeApiResponse class that mimics ScrapFly's response interface.
 """
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Dict, Any, Final, Mapping, Optional
 from parsel import Selector
 
+# Shared read-only sentinels returned for absent containers, so property
+# accessors don't allocate a fresh empty list/dict on every call. Callers
+# only ever iterate these; they must not be mutated.
+_EMPTY_TUPLE: Final[tuple] = ()
+_EMPTY_MAP: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Characters opening a JSON document / whitespace skipped when sniffing for one.
+_JSON_START_CHARS: Final = "{["
+_SNIFF_WHITESPACE: Final = " \t\n\r"
+
+# Parsed selectors cached by their HTML. Large scrapes often re-parse
+# identical pages (blocked/captcha shells, repeated error pages), and lxml
+# parsing dominates response handling - a cache hit replaces a full parse
+# with a much cheaper tree copy. Bounded LRU by total HTML size so retained
+# strings and trees can't grow without limit.
+_SELECTOR_CACHE: "OrderedDict[str, Selector]" = OrderedDict()
+_SELECTOR_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_selector_cache_bytes = 0
+# Tiny documents parse quickly enough that caching them isn't worth the
+# bookkeeping; documents this large would evict most of the cache on entry.
+_SELECTOR_CACHE_MIN_HTML = 1024
+_SELECTOR_CACHE_MAX_HTML = _SELECTOR_CACHE_MAX_BYTES // 4
+
+
+def _starts_with_json(s: str) -> bool:
+    """Check whether the first non-whitespace char opens a JSON document.
+
+    Equivalent to s.strip().startswith(('{', '[')) without allocating a
+    stripped copy of the (potentially multi-MB) string.
+    """
+    i = 0
+    n = len(s)
+    while i < n and s[i] in _SNIFF_WHITESPACE:
+        i += 1
+    return i < n and s[i] in _JSON_START_CHARS
+
+
+def _cached_selector(html: str) -> Selector:
+    """Return a parsed Selector for html, reusing a cached tree when possible.
+
+    Every caller gets its own tree (a deep copy of the cached one, done in C
+    by lxml): parsel trees are mutable via .drop()/.remove(), so handing out
+    the cached tree itself would let one response's edits leak into every
+    other response with identical HTML.
+    """
+    global _selector_cache_bytes
+    size = len(html)
+    if size < _SELECTOR_CACHE_MIN_HTML or size > _SELECTOR_CACHE_MAX_HTML:
+        return Selector(text=html)
+    selector = _SELECTOR_CACHE.get(html)
+    if selector is None:
+        selector = Selector(text=html)
+        _SELECTOR_CACHE[html] = selector
+        _selector_cache_bytes += size
+        while _selector_cache_bytes > _SELECTOR_CACHE_MAX_BYTES:
+            evicted, _ = _SELECTOR_CACHE.popitem(last=False)
+            _selector_cache_bytes -= len(evicted)
+    else:
+        _SELECTOR_CACHE.move_to_end(html)
+    return Selector(root=deepcopy(selector.root))
+
 
 class RequestInfo:
     """Simple class to hold request information for ScrapFly compatibility."""
+    __slots__ = ("url",)
+
     def __init__(self, url: str):
         self.url = url
 
@@ -15,69 +81,84 @@ class ScrapeApiResponse:
     """
     Response wrapper that provides a ScrapFly-compatible interface for Scrappey responses.
     """
-    
+
+    __slots__ = (
+        "_raw_response",
+        "_original_url",
+        "_solution",
+        "_selector",
+        "_context",
+        "_scrape_result",
+        "_is_json",
+        "_request",
+    )
+
     def __init__(self, scrappey_response: Dict[str, Any], original_url: str):
         self._raw_response = scrappey_response
         self._original_url = original_url
-        
-        solution = scrappey_response.get("solution", {})
-        # For HTML pages, use 'response'. For JSON APIs, 'innerText' has the raw content.
-        self._html = solution.get("html", solution.get("response", ""))
-        self._inner_text = solution.get("innerText", "")
+        self._solution = scrappey_response.get("solution") or _EMPTY_MAP
+        # The context/result dicts and the parsed selector are built lazily:
+        # most scrapers only touch .content or .selector, so eagerly
+        # assembling them here would be wasted work per response.
         self._selector: Optional[Selector] = None
-        
-        self._context = {
-            "url": solution.get("currentUrl", solution.get("url", original_url)),
-            "status_code": solution.get("statusCode", scrappey_response.get("status", 200)),
-            "cookies": solution.get("cookies", []),
-            "headers": solution.get("responseHeaders", solution.get("headers", {})),
-        }
-        
-        # Use innerText for content if it looks like JSON, otherwise use HTML
-        content = self._inner_text if self._inner_text.strip().startswith(('{', '[')) else self._html
-        
-        self._scrape_result = {
-            "browser_data": {
-                "xhr_call": solution.get("xhrCalls", []),
-                "javascript_evaluation_result": solution.get("jsResult"),
-                "screenshot": scrappey_response.get("screenshotUrl"),
-            },
-            "content": content,
-            "status_code": self._context["status_code"],
-            "url": self._context["url"],
-        }
-    
+        self._context: Optional[Dict[str, Any]] = None
+        self._scrape_result: Optional[Dict[str, Any]] = None
+        self._is_json: Optional[bool] = None
+        self._request: Optional[RequestInfo] = None
+
     @property
     def selector(self) -> Selector:
         if self._selector is None:
-            self._selector = Selector(text=self._html)
+            self._selector = _cached_selector(self.html)
         return self._selector
-    
+
     @property
     def content(self) -> str:
         """Returns innerText for JSON responses, HTML for regular pages."""
-        if self._inner_text and self._inner_text.strip().startswith(('{', '[')):
-            return self._inner_text
-        return self._html
-    
+        if self._is_json is None:
+            self._is_json = _starts_with_json(self.text)
+        return self.text if self._is_json else self.html
+
     @property
     def text(self) -> str:
         """Returns the raw innerText from the page."""
-        return self._inner_text
-    
+        return self._solution.get("innerText", "")
+
     @property
     def html(self) -> str:
         """Returns the HTML response."""
-        return self._html
-    
+        # For HTML pages, use 'response'. For JSON APIs, 'innerText' has the raw content.
+        return self._solution.get("html", self._solution.get("response", ""))
+
     @property
     def context(self) -> Dict[str, Any]:
+        if self._context is None:
+            solution = self._solution
+            self._context = {
+                "url": solution.get("currentUrl", solution.get("url", self._original_url)),
+                "status_code": solution.get("statusCode", self._raw_response.get("status", 200)),
+                "cookies": solution.get("cookies", []),
+                "headers": solution.get("responseHeaders", solution.get("headers", {})),
+            }
         return self._context
-    
+
     @property
     def scrape_result(self) -> Dict[str, Any]:
+        if self._scrape_result is None:
+            solution = self._solution
+            context = self.context
+            self._scrape_result = {
+                "browser_data": {
+                    "xhr_call": solution.get("xhrCalls", []),
+                    "javascript_evaluation_result": solution.get("jsResult"),
+                    "screenshot": self._raw_response.get("screenshotUrl"),
+                },
+                "content": self.content,
+                "status_code": context["status_code"],
+                "url": context["url"],
+            }
         return self._scrape_result
-    
+
     @property
     def result(self) -> Dict[str, Any]:
         """
@@ -85,24 +166,24 @@ class ScrapeApiResponse:
         This mimics the nested structure ScrapFly uses.
         """
         return {
-            "result": self._scrape_result
+            "result": self.scrape_result
         }
     
     @property
     def status_code(self) -> int:
-        return self._context.get("status_code", 200)
-    
+        return self.context.get("status_code", 200)
+
     @property
     def url(self) -> str:
-        return self._context.get("url", self._original_url)
-    
+        return self.context.get("url", self._original_url)
+
     @property
     def cookies(self) -> list:
-        return self._context.get("cookies", [])
-    
+        return self.context.get("cookies") or _EMPTY_TUPLE
+
     @property
     def headers(self) -> Dict[str, str]:
-        return self._context.get("headers", {})
+        return self.context.get("headers") or _EMPTY_MAP
     
     @property
     def raw_response(self) -> Dict[str, Any]:
@@ -111,7 +192,9 @@ class ScrapeApiResponse:
     @property
     def request(self) -> RequestInfo:
         """Returns request info for ScrapFly compatibility (response.request.url)."""
-        return RequestInfo(self._original_url)
+        if self._request is None:
+            self._request = RequestInfo(self._original_url)
+        return self._request
     
     @property
     def captcha_tokens(self) -> list:
@@ -119,8 +202,7 @@ class ScrapeApiResponse:
         Returns solved captcha tokens if automaticallySolveCaptchas was enabled.
         Each token includes captchaType, token, and timestamp.
         """
-        solution = self._raw_response.get("solution", {})
-        return solution.get("javascriptReturn", [])
+        return self._solution.get("javascriptReturn") or _EMPTY_TUPLE
     
     @property
     def additional_cost(self) -> float:
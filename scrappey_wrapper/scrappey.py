@@ -2,14 +2,49 @@
 ScrappeyClient - Main client class for interacting with Scrappey API.
 """
 import asyncio
+import hashlib
 import json
+import logging
 import os
 import random
 import re
-from typing import Dict, Any, Optional, List, AsyncIterator, Union
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional, List, AsyncIterable, AsyncIterator, Iterable, Tuple, Union
 
 import httpx
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+    def _json_dumps_sorted(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    # orjson is optional; fall back to stdlib json when unavailable
+    orjson = None
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _json_dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode("utf-8")
+
 from .config import ScrapeConfig
 from .response import ScrapeApiResponse
 from .exceptions import (
@@ -20,6 +55,13 @@ from .exceptions import (
     ScrapflyScrapeError,
 )
 
+# Buffered, level-gated logging instead of print on the request/retry paths;
+# applications can reconfigure or silence the "scrappey" logger as usual.
+_log = logging.getLogger("scrappey")
+
+# Compiled once; _extract_title runs on every debug-logged response
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+
 # Errors that should trigger a retry
 RETRYABLE_ERRORS = [
     "browser closed",
@@ -38,12 +80,62 @@ RETRYABLE_ERRORS = [
     "context destroyed",
 ]
 
+# Single alternation so retryability is one C-level scan of the message
+# instead of 14 substring tests plus a .lower() copy.
+_RETRYABLE_RE = re.compile("|".join(map(re.escape, RETRYABLE_ERRORS)), re.IGNORECASE)
+
+# API error codes mapped straight to exception classes; messages without a
+# mapped code are classified by this timeout pattern instead of a .lower() copy.
+_ERROR_CODE_MAP = {
+    "CODE-0001": ScrappeyAuthError,
+}
+_TIMEOUT_RE = re.compile(r"timeout", re.IGNORECASE)
+
+
+class _TokenBucket:
+    """Token bucket limiting sustained request rate to rate per second.
+
+    A Semaphore only bounds concurrency: when all slots free up at once the
+    next tick can still fire a full burst. The bucket refills continuously
+    from the event-loop clock, so request starts are actually spaced out.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated: Optional[float] = None
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        async with self.lock:
+            now = loop.time()
+            if self.updated is None:
+                self.updated = now
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1.0:
+                # Sleeping while holding the lock is intentional: waiters are
+                # released one token-interval apart rather than all at once.
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+                self.updated = loop.time()
+                self.tokens = 0.0
+            else:
+                self.tokens -= 1.0
+
 
 class ScrappeyClient:
     """
     Client for interacting with the Scrappey API.
     Provides a ScrapFly-compatible interface for easy migration.
-    
+
+    A client instance is bound to a single event loop: the pooled HTTP
+    client and internal synchronization primitives attach to the first loop
+    that uses them. Use either the async API (with aclose()) or the sync
+    scrape() entry point (with close()) on a given instance - don't mix
+    both; create separate clients instead.
+
     Args:
         key: Scrappey API key. If not provided, uses SCRAPPEY_KEY env variable.
         max_concurrency: Maximum concurrent requests (1-100, default: 100).
@@ -52,6 +144,17 @@ class ScrappeyClient:
         retry_delay: Initial retry delay in seconds (default: 1.0).
         retry_max_delay: Maximum retry delay in seconds (default: 30.0).
         debug: Enable debug logging (default: False, or set SCRAPPEY_DEBUG=1).
+        coalesce_requests: Share one upstream call between concurrent
+            identical payloads (default: False). Only enable for workloads
+            where duplicate URLs may be scraped concurrently and a shared
+            response is acceptable.
+        cache_path: Path to a SQLite file caching GET-style responses on
+            disk (default: None, cache disabled). Re-runs of the same URLs
+            are served locally without spending Scrappey quota.
+        cache_ttl: Seconds before a cached response expires (default: 86400).
+        rps: Cap on sustained requests per second (default: None, no cap).
+            Complements max_concurrency, which only bounds how many requests
+            are in flight, not how fast new ones start.
     
     Example:
         >>> client = ScrappeyClient(key="your-api-key", max_concurrency=50)
@@ -63,6 +166,36 @@ class ScrappeyClient:
     
     BASE_URL = "https://publisher.scrappey.com/api/v1"
     MAX_ALLOWED_CONCURRENCY = 100  # Scrappey supports up to 100 concurrent requests
+    SESSION_CACHE_TTL = 240.0  # seconds before a cached session ID is considered stale
+
+    __slots__ = (
+        "api_key",
+        "debug",
+        "max_concurrency",
+        "timeout",
+        "max_retries",
+        "retry_delay",
+        "retry_max_delay",
+        "_session_cache",
+        "_session_lock",
+        "_coalesce",
+        "_inflight",
+        "_cache_path",
+        "_cache_ttl",
+        "_cache_conn",
+        "_cache_lock",
+        "_bucket",
+        "_rng",
+        "_backoff_table",
+        "_api_url",
+        "_client",
+        "_bg_loop",
+        "_bg_thread",
+        "_bg_lock",
+        "_slot_limit",
+        "_active_slots",
+        "_slot_cond",
+    )
     
     def __init__(
         self,
@@ -73,6 +206,10 @@ class ScrappeyClient:
         retry_delay: float = 1.0,
         retry_max_delay: float = 30.0,
         debug: Optional[bool] = None,
+        coalesce_requests: bool = False,
+        cache_path: Optional[str] = None,
+        cache_ttl: int = 86400,
+        rps: Optional[float] = None,
     ):
         self.api_key = key or os.environ.get("SCRAPPEY_KEY")
         if not self.api_key:
@@ -84,12 +221,21 @@ class ScrappeyClient:
         if debug is None:
             debug = os.environ.get("SCRAPPEY_DEBUG", "").lower() in ("1", "true", "yes")
         self.debug = debug
+        if debug:
+            # debug=True should produce output even when the application
+            # hasn't configured logging itself
+            _log.setLevel(logging.DEBUG)
+            if not _log.handlers and not logging.getLogger().handlers:
+                _log.addHandler(logging.StreamHandler())
         
         # Validate and set concurrency (1-100)
         if max_concurrency < 1:
             max_concurrency = 1
         elif max_concurrency > self.MAX_ALLOWED_CONCURRENCY:
-            print(f"[Scrappey] Warning: max_concurrency {max_concurrency} exceeds limit, using {self.MAX_ALLOWED_CONCURRENCY}")
+            _log.warning(
+                "max_concurrency %d exceeds limit, using %d",
+                max_concurrency, self.MAX_ALLOWED_CONCURRENCY
+            )
             max_concurrency = self.MAX_ALLOWED_CONCURRENCY
         
         self.max_concurrency = max_concurrency
@@ -97,93 +243,314 @@ class ScrappeyClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.retry_max_delay = retry_max_delay
-        self._session_cache: Dict[str, str] = {}
-    
-    def _log_debug(self, message: str):
-        """Print debug message if debug mode is enabled."""
-        if self.debug:
-            print(f"[Scrappey DEBUG] {message}")
+        # Session IDs reused across scrapes, keyed by their creation kwargs
+        self._session_cache: Dict[bytes, Tuple[str, float]] = {}
+        self._session_lock = asyncio.Lock()
+        self._coalesce = coalesce_requests
+        # In-flight futures keyed by payload digest, used when coalescing
+        self._inflight: Dict[bytes, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._cache_path = cache_path
+        self._cache_ttl = cache_ttl
+        self._cache_conn: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
+        self._bucket = _TokenBucket(rps) if rps else None
+        # Per-client RNG for retry jitter: avoids the module-level random's
+        # global lock when scrape() is driven from multiple threads.
+        self._rng = random.Random()
+        # One client-wide slot counter gating batch concurrency, so
+        # overlapping concurrent_scrape/scrape_many calls share the limit
+        # instead of each bringing their own.
+        self._slot_limit = max_concurrency
+        self._active_slots = 0
+        self._slot_cond = asyncio.Condition()
+        # Background loop lazily started for the sync scrape() path
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_thread: Optional[threading.Thread] = None
+        self._bg_lock = threading.Lock()
+        # Base delays precomputed for every attempt (1 << i == 2**i), so the
+        # retry path never recomputes the exponential or re-clamps it.
+        self._backoff_table = tuple(
+            min(retry_delay * (1 << i), retry_max_delay)
+            for i in range(max_retries + 1)
+        )
+        # Formatted once; _make_request would otherwise rebuild this string
+        # on every call.
+        self._api_url = f"{self.BASE_URL}?key={self.api_key}"
+        # One long-lived client so repeat requests reuse pooled TCP+TLS
+        # connections instead of paying a handshake per call.
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max(max_concurrency * 2, 200),
+                max_keepalive_connections=max(max_concurrency, 100),
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def aclose(self):
+        """Close the pooled HTTP client and any open response cache."""
+        await self._client.aclose()
+        self._close_shared_state()
+
+    def close(self):
+        """Synchronous counterpart to aclose() for callers using scrape().
+
+        Closes the HTTP client on the background loop it ran on (or a
+        throwaway loop if scrape() was never called), then releases the
+        loop, its thread and the cache connection.
+        """
+        with self._bg_lock:
+            loop = self._bg_loop
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), loop).result()
+        else:
+            asyncio.run(self._client.aclose())
+        self._close_shared_state()
+
+    def _close_shared_state(self):
+        """Close the cache connection and stop, join and close the sync loop."""
+        if self._cache_conn is not None:
+            self._cache_conn.close()
+            self._cache_conn = None
+        with self._bg_lock:
+            loop, thread = self._bg_loop, self._bg_thread
+            self._bg_loop = None
+            self._bg_thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def __aenter__(self) -> "ScrappeyClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
     
     def _extract_title(self, html: str) -> str:
         """Extract page title from HTML."""
         if not html:
             return "(empty response)"
-        match = re.search(r'<title[^>]*>([^<]+)</title>', html, re.IGNORECASE)
+        # Locate the tag with a cheap str.find first so the regex only scans
+        # a small window instead of the whole (potentially huge) document.
+        start = html.find('<title')
+        if start < 0:
+            start = html.find('<TITLE')
+        if start >= 0:
+            match = _TITLE_RE.search(html, start, start + 4096)
+        else:
+            # Mixed-case tags are rare; fall back to the full scan for them
+            match = _TITLE_RE.search(html)
         if match:
             return match.group(1).strip()[:80]
         return "(no title)"
     
     def _is_retryable_error(self, error_message: str) -> bool:
         """Check if an error message indicates a retryable error."""
-        error_lower = error_message.lower()
-        return any(err in error_lower for err in RETRYABLE_ERRORS)
+        return _RETRYABLE_RE.search(error_message) is not None
     
     def _get_retry_delay(self, attempt: int) -> float:
-        """Calculate delay with exponential backoff and jitter."""
-        delay = self.retry_delay * (2 ** attempt)
-        delay = min(delay, self.retry_max_delay)
-        # Add jitter (±25%)
-        jitter = delay * 0.25 * (2 * random.random() - 1)
-        return delay + jitter
-    
-    @property
-    def _api_url(self) -> str:
-        return f"{self.BASE_URL}?key={self.api_key}"
+        """Look up the backoff delay for attempt and add jitter (±25%)."""
+        table = self._backoff_table
+        delay = table[attempt] if attempt < len(table) else self.retry_max_delay
+        return delay + delay * 0.25 * (2 * self._rng.random() - 1)
     
     async def _make_request(
         self,
         payload: Dict[str, Any],
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        stream: bool = False
+    ) -> Dict[str, Any]:
+        """POST payload to the API, with optional caching and coalescing."""
+        cache_key = None
+        # Only idempotent GET-style scrapes are cacheable; cache hits return
+        # before any concurrency gating so they stay near-instant.
+        if self._cache_path and payload.get("cmd") == "request.get":
+            cache_key = hashlib.blake2b(_json_dumps_sorted(payload), digest_size=16).digest()
+            # sqlite I/O is synchronous; run it in a thread so a disk read
+            # or a multi-MB commit never stalls the other in-flight requests
+            cached = await asyncio.to_thread(self._cache_get, cache_key)
+            if cached is not None:
+                return cached
+
+        if self._coalesce:
+            data = await self._coalesced_request(payload, timeout, stream)
+        else:
+            data = await self._request_once(payload, timeout, stream)
+
+        if cache_key is not None:
+            await asyncio.to_thread(self._cache_put, cache_key, data)
+        return data
+
+    def _cache_db(self) -> sqlite3.Connection:
+        """Open (once) the on-disk response cache."""
+        if self._cache_conn is None:
+            # check_same_thread=False: cache I/O runs in asyncio.to_thread
+            # workers, so the connection is used from multiple threads
+            # (serialized by _cache_lock)
+            conn = sqlite3.connect(self._cache_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache "
+                "(key BLOB PRIMARY KEY, created INTEGER, body BLOB)"
+            )
+            conn.commit()
+            self._cache_conn = conn
+        return self._cache_conn
+
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        # Runs via asyncio.to_thread; the lock serializes access to the
+        # single shared connection across those worker threads.
+        with self._cache_lock:
+            row = self._cache_db().execute(
+                "SELECT created, body FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        created, body = row
+        if time.time() - created >= self._cache_ttl:
+            return None
+        return _json_loads(body)
+
+    def _cache_put(self, key: bytes, data: Dict[str, Any]):
+        body = _json_dumps(data)
+        with self._cache_lock:
+            conn = self._cache_db()
+            conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, created, body) VALUES (?, ?, ?)",
+                (key, int(time.time()), body)
+            )
+            conn.commit()
+
+    async def _coalesced_request(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[int] = None,
+        stream: bool = False
     ) -> Dict[str, Any]:
+        """Issue the request, sharing it with concurrent identical payloads."""
+        key = hashlib.blake2b(_json_dumps_sorted(payload), digest_size=16).digest()
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Identical request already on the wire - wait for its result.
+            # shield() keeps a cancelled waiter from cancelling the owner.
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await self._request_once(payload, timeout, stream)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # mark retrieved when nobody else waits
+            else:
+                future.cancel()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            del self._inflight[key]
+
+    async def _request_once(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[int] = None,
+        stream: bool = False
+    ) -> Dict[str, Any]:
+        """POST payload to the API and decode the JSON response.
+
+        With stream=True the body is read incrementally via aiter_bytes and
+        joined once before decoding, avoiding httpx's internal buffering
+        copy - useful for the multi-megabyte rendered-HTML responses.
+        """
+        if self._bucket is not None:
+            # Rate-limit actual upstream calls only; cache hits and coalesced
+            # duplicates never reach this point.
+            await self._bucket.acquire()
+
         request_timeout = timeout or self.timeout
-        
+        # One gate for both log blocks; skips the expensive pretty-print
+        # whenever DEBUG output wouldn't be emitted anyway
+        debug = self.debug and _log.isEnabledFor(logging.DEBUG)
+
         # Log request payload in debug mode
-        if self.debug:
-            url = payload.get("url", "unknown")
+        if debug:
             # Create a sanitized payload for logging (hide sensitive data)
             log_payload = {k: v for k, v in payload.items() if k != "key"}
-            self._log_debug(f"→ Request to: {url}")
-            self._log_debug(f"  Payload: {json.dumps(log_payload, indent=2)}")
-        
-        async with httpx.AsyncClient(timeout=request_timeout) as client:
-            try:
-                response = await client.post(
+            _log.debug("→ Request to: %s", payload.get("url", "unknown"))
+            _log.debug("  Payload: %s", _json_pretty(log_payload))
+
+        try:
+            if stream:
+                async with self._client.stream(
+                    "POST",
                     self._api_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
+                    content=_json_dumps(payload),
+                    timeout=request_timeout
+                ) as response:
+                    body = b"".join([chunk async for chunk in response.aiter_bytes()])
+            else:
+                response = await self._client.post(
+                    self._api_url,
+                    content=_json_dumps(payload),
+                    timeout=request_timeout
+                )
+                body = response.content
+
+            data = _json_loads(body)
+
+            # Log response in debug mode
+            if debug:
+                solution = data.get("solution", {})
+                html = solution.get("response", solution.get("html", ""))
+                title = self._extract_title(html)
+                status = solution.get("statusCode", "?")
+                current_url = solution.get("currentUrl", payload.get("url", "?"))
+                elapsed = data.get("timeElapsed", "?")
+                _log.debug("← Response: %s | Title: %s", status, title)
+                _log.debug("  URL: %s | Time: %sms", current_url, elapsed)
+
+            if "error" in data:
+                error_code = data.get("code", "UNKNOWN")
+                error_message = data.get("error", "Unknown error")
+                error_cls = _ERROR_CODE_MAP.get(error_code) or (
+                    ScrappeyTimeoutError if _TIMEOUT_RE.search(error_message)
+                    else ScrappeyRequestError
                 )
-                
-                data = response.json()
-                
-                # Log response in debug mode
-                if self.debug:
-                    solution = data.get("solution", {})
-                    html = solution.get("response", solution.get("html", ""))
-                    title = self._extract_title(html)
-                    status = solution.get("statusCode", "?")
-                    current_url = solution.get("currentUrl", payload.get("url", "?"))
-                    elapsed = data.get("timeElapsed", "?")
-                    self._log_debug(f"← Response: {status} | Title: {title}")
-                    self._log_debug(f"  URL: {current_url} | Time: {elapsed}ms")
-                
-                if "error" in data:
-                    error_code = data.get("code", "UNKNOWN")
-                    error_message = data.get("error", "Unknown error")
-                    
-                    if error_code == "CODE-0001":
-                        raise ScrappeyAuthError(error_message, error_code, data)
-                    elif "timeout" in error_message.lower():
-                        raise ScrappeyTimeoutError(error_message, error_code, data)
-                    else:
-                        raise ScrappeyRequestError(error_message, error_code, data)
-                
-                return data
-                
-            except httpx.TimeoutException as e:
-                raise ScrappeyTimeoutError(f"Request timed out: {e}")
-            except httpx.HTTPError as e:
-                raise ScrappeyRequestError(f"HTTP error: {e}")
+                raise error_cls(error_message, error_code, data)
+
+            return data
+
+        except httpx.TimeoutException as e:
+            raise ScrappeyTimeoutError(f"Request timed out: {e}")
+        except httpx.HTTPError as e:
+            raise ScrappeyRequestError(f"HTTP error: {e}")
     
+    async def _acquire_slot(self):
+        async with self._slot_cond:
+            await self._slot_cond.wait_for(lambda: self._active_slots < self._slot_limit)
+            self._active_slots += 1
+
+    async def _release_slot(self):
+        async with self._slot_cond:
+            self._active_slots -= 1
+            self._slot_cond.notify(1)
+
+    async def set_concurrency(self, max_concurrency: int):
+        """Adjust the shared batch-concurrency limit at runtime.
+
+        Raising the limit wakes queued work immediately; lowering it takes
+        effect as in-flight scrapes finish.
+        """
+        if max_concurrency < 1:
+            max_concurrency = 1
+        elif max_concurrency > self.MAX_ALLOWED_CONCURRENCY:
+            max_concurrency = self.MAX_ALLOWED_CONCURRENCY
+        async with self._slot_cond:
+            self._slot_limit = max_concurrency
+            self._slot_cond.notify_all()
+
     async def create_session(self, **kwargs) -> str:
         payload = {"cmd": "sessions.create", **kwargs}
         response = await self._make_request(payload)
@@ -196,6 +563,38 @@ class ScrappeyClient:
         payload = {"cmd": "sessions.destroy", "session": session_id}
         await self._make_request(payload)
         return True
+
+    async def get_or_create_session(self, **kwargs) -> str:
+        """Return a cached session ID for these settings, creating one if needed.
+
+        Sessions are keyed by their creation kwargs, so scrapes that share
+        proxy/browser settings reuse one session instead of paying a
+        sessions.create round-trip each. Cached IDs older than
+        SESSION_CACHE_TTL are treated as stale and recreated.
+        """
+        key = _json_dumps_sorted(kwargs)
+        entry = self._session_cache.get(key)
+        if entry is not None and time.time() - entry[1] < self.SESSION_CACHE_TTL:
+            return entry[0]
+        async with self._session_lock:
+            # Double-check: another coroutine may have created it while we
+            # waited on the lock
+            entry = self._session_cache.get(key)
+            if entry is not None and time.time() - entry[1] < self.SESSION_CACHE_TTL:
+                return entry[0]
+            session_id = await self.create_session(**kwargs)
+            self._session_cache[key] = (session_id, time.time())
+            return session_id
+
+    async def drop_session(self, **kwargs) -> None:
+        """Forget and destroy the cached session for these settings.
+
+        Used to rotate a session that has been blocked or banned; the next
+        get_or_create_session call with the same kwargs creates a fresh one.
+        """
+        entry = self._session_cache.pop(_json_dumps_sorted(kwargs), None)
+        if entry is not None:
+            await self.destroy_session(entry[0])
     
     async def async_scrape(
         self,
@@ -203,7 +602,12 @@ class ScrappeyClient:
         session_id: Optional[str] = None
     ) -> ScrapeApiResponse:
         payload = config.to_scrappey_payload(session_id)
-        
+
+        # With retries disabled, skip the loop and its exception-handling
+        # scaffolding entirely and let errors propagate to the caller.
+        if self.max_retries == 0:
+            return ScrapeApiResponse(await self._make_request(payload), config.url)
+
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
@@ -214,23 +618,28 @@ class ScrappeyClient:
                 raise
             except (ScrappeyError, ScrappeyRequestError, ScrappeyTimeoutError, httpx.HTTPError, Exception) as e:
                 last_error = e
-                error_message = str(e)
-                error_short = error_message[:150].replace('\n', ' ')
-                
+                # Built once per attempt, only for logging; no separate
+                # full-message copy and no re-lowering of the error text
+                error_short = str(e)[:150].replace('\n', ' ')
+
                 # Don't retry if we've exhausted attempts
                 if attempt >= self.max_retries:
-                    print(f"[Scrappey] ❌ Failed after {self.max_retries + 1} attempts for {config.url}")
-                    print(f"[Scrappey]    Last error: {error_short}")
+                    _log.error(
+                        "Failed after %d attempts for %s: %s",
+                        self.max_retries + 1, config.url, error_short
+                    )
                     break
-                
+
                 # Calculate delay and wait
                 delay = self._get_retry_delay(attempt)
-                print(f"[Scrappey] ⚠️  Error on {config.url}: {error_short}")
-                print(f"[Scrappey]    Retrying in {delay:.1f}s (attempt {attempt + 2}/{self.max_retries + 1})")
+                _log.warning(
+                    "Error on %s: %s - retrying in %.1fs (attempt %d/%d)",
+                    config.url, error_short, delay, attempt + 2, self.max_retries + 1
+                )
                 await asyncio.sleep(delay)
         
         # All retries exhausted - return an empty response instead of crashing
-        print(f"[Scrappey] ⚠️  Returning empty response for {config.url} after all retries failed")
+        _log.warning("Returning empty response for %s after all retries failed", config.url)
         return ScrapeApiResponse(
             {"solution": {"html": "", "status": 0}, "error": str(last_error)},
             config.url
@@ -238,33 +647,154 @@ class ScrappeyClient:
     
     async def concurrent_scrape(
         self,
-        configs: List[ScrapeConfig],
+        configs: Union[Iterable[ScrapeConfig], AsyncIterable[ScrapeConfig]],
         session_id: Optional[str] = None
     ) -> AsyncIterator[Union[ScrapeApiResponse, ScrapflyScrapeError]]:
-        semaphore = asyncio.Semaphore(self.max_concurrency)
-        
-        async def scrape_with_semaphore(config: ScrapeConfig) -> Union[ScrapeApiResponse, ScrapflyScrapeError]:
+        # Fixed pool of workers draining a bounded queue: only as many tasks
+        # as can actually run are ever live, instead of one task (and
+        # semaphore waiter) per config. Configs are pulled from the source
+        # lazily, so an async iterable fed by a database or queue is never
+        # materialized - the bounded in_queue backpressures the producer.
+        # Sized inputs (the common small-list case in the scrapers) cap the
+        # pool at their length; only unsized streams get the full pool.
+        worker_count = self.max_concurrency
+        if not isinstance(configs, AsyncIterable) and hasattr(configs, "__len__"):
+            worker_count = min(worker_count, len(configs))
+        in_queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+        out_queue: asyncio.Queue = asyncio.Queue()
+
+        if isinstance(configs, AsyncIterable):
+            source = configs
+        else:
+            async def _iterate(items=configs):
+                for item in items:
+                    yield item
+            source = _iterate()
+
+        source_error: Optional[BaseException] = None
+        worker_error: Optional[BaseException] = None
+
+        async def producer():
+            nonlocal source_error
+            try:
+                async for config in source:
+                    await in_queue.put(config)
+            except Exception as e:
+                # A failing source must not be swallowed, but the workers
+                # still need their shutdown sentinels or the pool (and the
+                # consumer) would block forever; re-raised after the drain.
+                source_error = e
+            finally:
+                for _ in range(worker_count):
+                    await in_queue.put(None)  # one shutdown sentinel per worker
+
+        async def worker():
+            nonlocal worker_error
+            try:
+                while True:
+                    config = await in_queue.get()
+                    if config is None:
+                        return
+                    await self._acquire_slot()
+                    try:
+                        result: Union[ScrapeApiResponse, ScrapflyScrapeError] = (
+                            await self.async_scrape(config, session_id)
+                        )
+                    except ScrappeyError as e:
+                        error = ScrapflyScrapeError(
+                            message=str(e),
+                            code=getattr(e, 'code', None),
+                            api_response=getattr(e, 'api_response', None)
+                        )
+                        error.api_response = {"config": {"url": config.url}}
+                        result = error
+                    except Exception as e:
+                        # Unexpected failures (anything that isn't a wrapped
+                        # ScrappeyError) must reach the caller instead of
+                        # silently shrinking the result stream; stash the
+                        # first one and re-raise it after the drain, like
+                        # source_error.
+                        if worker_error is None:
+                            worker_error = e
+                        return
+                    finally:
+                        await self._release_slot()
+                    await out_queue.put(result)
+            finally:
+                # None on the output marks one worker done; results are
+                # never None, so the consumer can count these to know when
+                # the stream is drained.
+                out_queue.put_nowait(None)
+
+        tasks = [asyncio.create_task(producer())]
+        tasks += [asyncio.create_task(worker()) for _ in range(worker_count)]
+        try:
+            remaining_workers = worker_count
+            while remaining_workers:
+                result = await out_queue.get()
+                if result is None:
+                    remaining_workers -= 1
+                else:
+                    yield result
+            if source_error is not None:
+                raise source_error
+            if worker_error is not None:
+                raise worker_error
+        finally:
+            # If the consumer stops early, don't leave the pool running
+            for task in tasks:
+                task.cancel()
+    
+    async def scrape_many(
+        self,
+        configs: List[ScrapeConfig],
+        session_id: Optional[str] = None,
+        concurrency: Optional[int] = None
+    ) -> List[ScrapeApiResponse]:
+        """Scrape many configs concurrently and return responses in input order.
+
+        Unlike concurrent_scrape, which yields results as they complete,
+        this fans the requests out over a bounded semaphore and gathers
+        everything, which is the convenient form when the caller needs the
+        full result set anyway.
+        """
+        limit = min(concurrency or self.max_concurrency, self.max_concurrency)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def scrape_bounded(config: ScrapeConfig) -> ScrapeApiResponse:
             async with semaphore:
+                # also count against the client-wide slot limit shared with
+                # any concurrently running batches
+                await self._acquire_slot()
                 try:
                     return await self.async_scrape(config, session_id)
-                except ScrappeyError as e:
-                    error = ScrapflyScrapeError(
-                        message=str(e),
-                        code=getattr(e, 'code', None),
-                        api_response=getattr(e, 'api_response', None)
-                    )
-                    error.api_response = {"config": {"url": config.url}}
-                    return error
-        
-        tasks = [scrape_with_semaphore(config) for config in configs]
-        
-        for coro in asyncio.as_completed(tasks):
-            result = await coro
-            yield result
-    
+                finally:
+                    await self._release_slot()
+
+        return list(await asyncio.gather(*[scrape_bounded(config) for config in configs]))
+
+    def _ensure_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Start (once) a daemon thread running an event loop for sync calls."""
+        with self._bg_lock:
+            if self._bg_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="scrappey-sync", daemon=True
+                )
+                thread.start()
+                self._bg_loop = loop
+                self._bg_thread = thread
+            return self._bg_loop
+
     def scrape(self, config: ScrapeConfig) -> ScrapeApiResponse:
-        """Synchronous scrape method for compatibility."""
-        return asyncio.get_event_loop().run_until_complete(self.async_scrape(config))
+        """Synchronous scrape method for compatibility.
+
+        Runs on a persistent background event loop so repeated sync calls
+        reuse the pooled HTTP client (and its keep-alive connections)
+        instead of constructing a fresh loop per call.
+        """
+        loop = self._ensure_background_loop()
+        return asyncio.run_coroutine_threadsafe(self.async_scrape(config), loop).result()
 
 
 # Alias for ScrapFly compatibility